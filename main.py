@@ -6,10 +6,15 @@ Provides mock procurement APIs for supplier search, quotes, routing, and health
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from datetime import datetime
+from fastapi.responses import ORJSONResponse, Response
+import asyncio
 import logging
 
+import orjson
+
 from src.core.config import settings
+from src.core.cache import cache_manager, TTL_POLICIES
+from src.core.utils import preload_supplier_data, run_clock, now_fast
 from src.domain.schemas import HealthStatus
 from src.routes import suppliers
 
@@ -24,33 +29,91 @@ app = FastAPI(
     description="AI-driven procurement and supplier integration layer for PRISMA supply chain optimization",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# CORS middleware (explicit methods/headers; skipped when CORS is disabled)
+if settings.CORS_ENABLED:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["GET", "POST"],
+        allow_headers=["Content-Type", "Authorization"],
+    )
 
 # Include routers
 app.include_router(suppliers.router)
 
+# Static part of the health payload; only the timestamp varies.
+# Handlers return the response directly so FastAPI skips response_model validation.
+_HEALTH_BASE = {
+    "status": "healthy",
+    "version": settings.API_VERSION,
+    "mode": settings.SOURCE_MODE,
+}
+
+
+# Seconds-resolution UTC timestamp of the current health body (see _health_body())
+CURRENT_TS_ISO = now_fast().isoformat(timespec="seconds")
+
+
+def _render_health() -> bytes:
+    """Serialize the health payload for the current tick"""
+    return orjson.dumps({**_HEALTH_BASE, "timestamp": CURRENT_TS_ISO})
+
+
+# Pre-rendered health body; handlers serve these bytes without any encoding work
+_HEALTH_BODY = _render_health()
+_health_clock = None
+
+# Background tasks started on startup and cancelled on shutdown
+_background_tasks = []
+
+
+def _health_body() -> bytes:
+    """
+    Health body for the current second, timed by the shared now_fast() clock.
+    
+    now_fast() returns the same object until run_clock() ticks, so the
+    timestamp is only re-formatted once per tick and the body re-rendered
+    once per second.
+    """
+    global CURRENT_TS_ISO, _HEALTH_BODY, _health_clock
+    now = now_fast()
+    if now is not _health_clock:
+        _health_clock = now
+        timestamp = now.isoformat(timespec="seconds")
+        if timestamp != CURRENT_TS_ISO:
+            CURRENT_TS_ISO = timestamp
+            _HEALTH_BODY = _render_health()
+    return _HEALTH_BODY
+
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize resources on startup"""
+    # Fail fast on missing/invalid supplier files instead of on first request
+    preload_supplier_data()
+    
+    _background_tasks.append(asyncio.create_task(cache_manager.run_sweeper()))
+    _background_tasks.append(asyncio.create_task(run_clock()))
+    
     logger.info(f"🚀 PRISMA Procurement API starting...")
     logger.info(f"   Mode: {settings.SOURCE_MODE}")
     logger.info(f"   Port: {settings.API_PORT}")
-    logger.info(f"   Cache TTL: {settings.CACHE_TTL_HOURS}h")
+    logger.info("   Cache TTL: " + ", ".join(
+        f"{policy} {low:g}-{high:g}s" for policy, (low, high) in TTL_POLICIES.items()
+    ))
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup resources on shutdown"""
+    for task in _background_tasks:
+        task.cancel()
+    _background_tasks.clear()
+    
     logger.info("👋 PRISMA Procurement API shutting down...")
 
 
@@ -61,12 +124,7 @@ async def health_check():
     
     Returns basic service status and configuration information.
     """
-    return HealthStatus(
-        status="healthy",
-        version=settings.API_VERSION,
-        mode=settings.SOURCE_MODE,
-        timestamp=datetime.utcnow()
-    )
+    return Response(content=_health_body(), media_type="application/json")
 
 
 @app.get("/health", response_model=HealthStatus, tags=["Health"])
@@ -76,20 +134,31 @@ async def health():
     
     Returns service health status with timestamp.
     """
-    return HealthStatus(
-        status="healthy",
-        version=settings.API_VERSION,
-        mode=settings.SOURCE_MODE,
-        timestamp=datetime.utcnow()
-    )
+    return Response(content=_health_body(), media_type="application/json")
 
 
 if __name__ == "__main__":
+    import os
     import uvicorn
-    uvicorn.run(
-        "main:app",
-        host=settings.API_HOST,
-        port=settings.API_PORT,
-        reload=True
-    )
+    
+    if settings.DEV_RELOAD:
+        # Development: single process with auto-reload
+        uvicorn.run(
+            "main:app",
+            host=settings.API_HOST,
+            port=settings.API_PORT,
+            reload=True
+        )
+    else:
+        # Production: multiple workers on uvloop + httptools, no access log
+        uvicorn.run(
+            "main:app",
+            host=settings.API_HOST,
+            port=settings.API_PORT,
+            workers=settings.API_WORKERS or (2 * (os.cpu_count() or 1) + 1),
+            loop="uvloop",
+            http="httptools",
+            access_log=False,
+            reload=False
+        )
 
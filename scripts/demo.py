@@ -10,11 +10,26 @@ Demonstrates end-to-end procurement flow:
 import asyncio
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from requests.adapters import HTTPAdapter
 
 
 BASE_URL = "http://localhost:8001"
 
+# Endpoint URLs (built once)
+HEALTH_URL = f"{BASE_URL}/"
+SEARCH_URL = f"{BASE_URL}/ext/suppliers/search"
+QUOTE_URL = f"{BASE_URL}/ext/suppliers/quote"
+ROUTE_URL = f"{BASE_URL}/ext/route/eta"
+SOURCES_URL = f"{BASE_URL}/ext/sources"
+
+# Shared session: keeps connections alive across calls instead of reconnecting
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
 # Test location: Bandlaguda Jagir, Hyderabad
 TEST_ORIGIN = {
     "latitude": 17.3352,
@@ -54,7 +69,7 @@ def test_health_check():
     print_section("TEST 1: Health Check")
     
     try:
-        response = requests.get(f"{BASE_URL}/")
+        response = SESSION.get(HEALTH_URL)
         print(f"Status: {response.status_code}")
         print_json(response.json())
         return response.status_code == 200
@@ -74,8 +89,8 @@ def test_supplier_search(material="cement_opc_53", quantity=50.0):
     }
     
     try:
-        response = requests.post(
-            f"{BASE_URL}/ext/suppliers/search",
+        response = SESSION.post(
+            SEARCH_URL,
             json=payload,
             headers={"Content-Type": "application/json"}
         )
@@ -124,6 +139,44 @@ def test_supplier_search(material="cement_opc_53", quantity=50.0):
         return None
 
 
+def _search_material(material, quantity=50.0):
+    """Search one material without printing; returns (material, status, data)"""
+    payload = {
+        "origin": TEST_ORIGIN,
+        "material": material,
+        "quantity_tons": quantity
+    }
+    response = SESSION.post(SEARCH_URL, json=payload)
+    data = response.json() if response.status_code == 200 else None
+    return material, response.status_code, data
+
+
+def test_all_materials():
+    """Test 2b: Search all materials concurrently over the pooled session"""
+    print_section("TEST 2b: Search All Materials (concurrent)")
+    
+    try:
+        start = datetime.now()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(_search_material, MATERIALS))
+        duration = (datetime.now() - start).total_seconds() * 1000
+        
+        for material, status, data in results:
+            if data:
+                rec = data.get('recommended') or {}
+                print(f"   • {material}: {len(data['suppliers'])} suppliers, "
+                      f"recommended {rec.get('name', 'none')}")
+            else:
+                print(f"   ❌ {material}: status {status}")
+        
+        print(f"\n⚡ {len(MATERIALS)} searches in {duration:.0f}ms")
+        return all(status == 200 for _, status, _ in results)
+        
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
+
 def test_quote(supplier_id, material="cement_opc_53", quantity=50.0):
     """Test 3: Request price quote"""
     print_section(f"TEST 3: Request Quote - {supplier_id}")
@@ -136,8 +189,8 @@ def test_quote(supplier_id, material="cement_opc_53", quantity=50.0):
     }
     
     try:
-        response = requests.post(
-            f"{BASE_URL}/ext/suppliers/quote",
+        response = SESSION.post(
+            QUOTE_URL,
             json=payload,
             headers={"Content-Type": "application/json"}
         )
@@ -183,8 +236,8 @@ def test_route_eta(destination):
     }
     
     try:
-        response = requests.post(
-            f"{BASE_URL}/ext/route/eta",
+        response = SESSION.post(
+            ROUTE_URL,
             json=payload,
             headers={"Content-Type": "application/json"}
         )
@@ -219,7 +272,7 @@ def test_sources_health():
     print_section("TEST 5: Data Sources Health")
     
     try:
-        response = requests.get(f"{BASE_URL}/ext/sources")
+        response = SESSION.get(SOURCES_URL)
         
         print(f"Status: {response.status_code}")
         
@@ -262,7 +315,7 @@ def test_cache_behavior():
         # First request (cache miss)
         print("🔍 First request (should be cache MISS)...")
         start = datetime.now()
-        response1 = requests.post(f"{BASE_URL}/ext/suppliers/search", json=payload)
+        response1 = SESSION.post(SEARCH_URL, json=payload)
         duration1 = (datetime.now() - start).total_seconds() * 1000
         
         if response1.status_code == 200:
@@ -274,7 +327,7 @@ def test_cache_behavior():
         # Second request (cache hit)
         print("\n🔍 Second request (should be cache HIT)...")
         start = datetime.now()
-        response2 = requests.post(f"{BASE_URL}/ext/suppliers/search", json=payload)
+        response2 = SESSION.post(SEARCH_URL, json=payload)
         duration2 = (datetime.now() - start).total_seconds() * 1000
         
         if response2.status_code == 200:
@@ -311,6 +364,9 @@ def run_comprehensive_demo():
         print("\n❌ Supplier search failed")
         return
     
+    # Test 2b: Search every material concurrently
+    test_all_materials()
+    
     # Get recommended supplier for next tests
     recommended = search_result.get('recommended')
     if not recommended:
@@ -1,26 +1,82 @@
 """
 Simple in-memory cache with TTL support for PRISMA Procurement API
 """
-from typing import Any, Optional, Dict
-from datetime import datetime, timedelta
+from typing import Any, Optional, Dict, List, Tuple, Literal
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from datetime import datetime, timezone
+from functools import lru_cache
 import asyncio
 import hashlib
-import json
+import time
+
+from src.core.config import settings
+
+
+TTLPolicy = Literal["short", "normal", "long"]
+
+# (min, max) TTL in seconds per policy
+TTL_POLICIES: Dict[str, Tuple[float, float]] = {
+    "short": (settings.CACHE_TTL_SHORT_S, settings.CACHE_TTL_NORMAL_S),
+    "normal": (settings.CACHE_TTL_NORMAL_S, settings.CACHE_TTL_LONG_S),
+    "long": (settings.CACHE_TTL_LONG_S, settings.CACHE_TTL_LONG_S * 24),
+}
+
+NS_PER_SECOND = 1_000_000_000
+
+# Expensive results are kept longer: TTL = generation time x factor, clamped to the policy range
+ADAPTIVE_TTL_FACTOR = 5
+
+
+@lru_cache(maxsize=4096)
+def _key_from_tuple(items: Tuple[Tuple[str, Any], ...]) -> str:
+    """
+    Hash a canonical (sorted) tuple of key-value pairs into a cache key.
+    
+    Memoized so repeated queries skip hashing entirely.
+    
+    Args:
+        items: Sorted tuple of (name, value) pairs with hashable values
+        
+    Returns:
+        16-character BLAKE2b hex digest of the tuple representation
+    """
+    # Keys never leave the process, so a fast non-truncated 8-byte digest suffices
+    return hashlib.blake2b(repr(items).encode(), digest_size=8).hexdigest()
 
 
 class CacheManager:
-    """In-memory cache with Time-To-Live (TTL) support"""
+    """
+    In-memory cache with Time-To-Live (TTL) support.
+    
+    Storing data=None records a negative result ("nothing found"); get()
+    reports it as a hit with negative=True, distinct from a miss.
     
-    def __init__(self, default_ttl_hours: int = 24):
+    Entries are stored as (data, expiry_ns, stored_at_ns, cached_at_ns) tuples:
+    expiry and age use integer time.monotonic_ns(); the wall-clock cached_at
+    (time.time_ns()) is only converted to a datetime when returned.
+    No lock is needed: the cache is only touched from the event loop and no
+    await happens between reading and writing an entry.
+    
+    The number of entries is bounded; the least recently used entry is
+    evicted once the bound is exceeded.
+    
+    A list of (expiry_ns, key) pairs sorted by expiry is kept in sync with the
+    entries, so counting or purging expired entries doesn't scan the cache.
+    """
+    
+    def __init__(self, default_ttl_hours: int = 24, max_entries: int = 10_000):
         """
         Initialize cache manager.
         
         Args:
             default_ttl_hours: Default cache TTL in hours
+            max_entries: Maximum number of entries kept before LRU eviction
         """
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._default_ttl = timedelta(hours=default_ttl_hours)
-        self._lock = asyncio.Lock()
+        self._cache: "OrderedDict[str, Tuple[Any, int, int, int]]" = OrderedDict()
+        self._expiry_index: List[Tuple[int, str]] = []
+        self._default_ttl_ns = default_ttl_hours * 3600 * NS_PER_SECOND
+        self._max_entries = max_entries
     
     def _generate_key(self, **kwargs) -> str:
         """
@@ -30,11 +86,19 @@ class CacheManager:
             **kwargs: Key-value pairs to create cache key
             
         Returns:
-            SHA256 hash of sorted arguments
+            BLAKE2b hash of sorted arguments
         """
-        # Sort and stringify arguments
-        key_string = json.dumps(kwargs, sort_keys=True)
-        return hashlib.sha256(key_string.encode()).hexdigest()[:16]
+        # Sorting canonicalizes the arguments, so repr() is a stable input
+        return _key_from_tuple(tuple(sorted(kwargs.items())))
+    
+    def _remove(self, cache_key: str):
+        """Remove an entry and its expiry index record, if present."""
+        entry = self._cache.pop(cache_key, None)
+        if entry is not None:
+            index = self._expiry_index
+            pos = bisect_left(index, (entry[1], cache_key))
+            if pos < len(index) and index[pos][1] == cache_key:
+                del index[pos]
     
     async def get(self, **kwargs) -> Optional[Dict[str, Any]]:
         """
@@ -44,56 +108,83 @@ class CacheManager:
             **kwargs: Key-value pairs to identify cache entry
             
         Returns:
-            Cached data with metadata or None if not found/expired
+            Cached data with metadata, or None if not found/expired.
+            For negative entries, data is None and negative is True.
         """
-        async with self._lock:
-            cache_key = self._generate_key(**kwargs)
-            
-            if cache_key not in self._cache:
-                return None
-            
-            entry = self._cache[cache_key]
-            expiry = entry.get("expiry")
-            
-            # Check if expired
-            if expiry and datetime.utcnow() > expiry:
-                del self._cache[cache_key]
-                return None
-            
-            # Calculate cache age
-            cached_at = entry.get("cached_at", datetime.utcnow())
-            age_seconds = int((datetime.utcnow() - cached_at).total_seconds())
+        cache_key = self._generate_key(**kwargs)
+        entry = self._cache.get(cache_key)
+        if entry is None:
+            return None
+        
+        data, expiry_ns, stored_at_ns, cached_at_ns = entry
+        now_ns = time.monotonic_ns()
+        
+        # Check if expired
+        if now_ns > expiry_ns:
+            self._remove(cache_key)
+            return None
+        
+        # Mark as most recently used
+        self._cache.move_to_end(cache_key)
+        
+        return {
+            "data": data,
+            "cached_at": datetime.fromtimestamp(cached_at_ns / NS_PER_SECOND, tz=timezone.utc),
+            "age_seconds": (now_ns - stored_at_ns) // NS_PER_SECOND,
+            "cache_hit": True,
+            "negative": data is None
+        }
+    
+    def _resolve_ttl(self, ttl_hours: Optional[int], policy: Optional[TTLPolicy],
+                     generation_ms: Optional[float]) -> int:
+        """
+        Resolve the TTL in nanoseconds for a new entry.
+        
+        Args:
+            ttl_hours: Explicit time-to-live in hours
+            policy: TTL policy name; takes precedence over ttl_hours
+            generation_ms: Time it took to produce the data, used to pad the TTL
             
-            return {
-                "data": entry.get("data"),
-                "cached_at": cached_at,
-                "age_seconds": age_seconds,
-                "cache_hit": True
-            }
+        Returns:
+            TTL in nanoseconds
+        """
+        if policy is not None:
+            ttl_min, ttl_max = TTL_POLICIES[policy]
+            padded = (generation_ms or 0.0) / 1000.0 * ADAPTIVE_TTL_FACTOR
+            return int(min(max(padded, ttl_min), ttl_max) * NS_PER_SECOND)
+        return ttl_hours * 3600 * NS_PER_SECOND if ttl_hours else self._default_ttl_ns
     
-    async def set(self, data: Any, ttl_hours: Optional[int] = None, **kwargs):
+    async def set(self, data: Any, ttl_hours: Optional[int] = None,
+                  policy: Optional[TTLPolicy] = None,
+                  generation_ms: Optional[float] = None, **kwargs):
         """
         Store value in cache with TTL.
         
         Args:
-            data: Data to cache
+            data: Data to cache; None stores a negative result
             ttl_hours: Time-to-live in hours (uses default if None)
+            policy: TTL policy ("short", "normal", "long"); overrides ttl_hours
+            generation_ms: Time spent generating data, pads the policy TTL
             **kwargs: Key-value pairs to identify cache entry
         """
-        async with self._lock:
-            cache_key = self._generate_key(**kwargs)
-            ttl = timedelta(hours=ttl_hours) if ttl_hours else self._default_ttl
-            
-            self._cache[cache_key] = {
-                "data": data,
-                "cached_at": datetime.utcnow(),
-                "expiry": datetime.utcnow() + ttl
-            }
+        cache_key = self._generate_key(**kwargs)
+        ttl_ns = self._resolve_ttl(ttl_hours, policy, generation_ms)
+        now_ns = time.monotonic_ns()
+        
+        expiry_ns = now_ns + ttl_ns
+        
+        self._remove(cache_key)
+        self._cache[cache_key] = (data, expiry_ns, now_ns, time.time_ns())
+        insort(self._expiry_index, (expiry_ns, cache_key))
+        
+        # Evict least recently used entry when over capacity
+        if len(self._cache) > self._max_entries:
+            self._remove(next(iter(self._cache)))
     
     async def clear(self):
         """Clear all cache entries."""
-        async with self._lock:
-            self._cache.clear()
+        self._cache.clear()
+        self._expiry_index.clear()
     
     async def delete(self, **kwargs):
         """
@@ -102,10 +193,34 @@ class CacheManager:
         Args:
             **kwargs: Key-value pairs to identify cache entry
         """
-        async with self._lock:
-            cache_key = self._generate_key(**kwargs)
-            if cache_key in self._cache:
-                del self._cache[cache_key]
+        self._remove(self._generate_key(**kwargs))
+    
+    def purge_expired(self) -> int:
+        """
+        Remove all expired entries.
+        
+        Returns:
+            Number of entries removed
+        """
+        # Expired entries form a prefix of the expiry index
+        expired = bisect_left(self._expiry_index, (time.monotonic_ns(),))
+        for _, key in self._expiry_index[:expired]:
+            del self._cache[key]
+        del self._expiry_index[:expired]
+        return expired
+    
+    async def run_sweeper(self, interval_seconds: float = 60.0):
+        """
+        Periodically purge expired entries so they don't linger until re-accessed.
+        
+        Intended to run as a background task for the lifetime of the app.
+        
+        Args:
+            interval_seconds: Delay between sweeps in seconds
+        """
+        while True:
+            await asyncio.sleep(interval_seconds)
+            self.purge_expired()
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -115,20 +230,15 @@ class CacheManager:
             Dictionary with cache stats
         """
         total_entries = len(self._cache)
-        expired = 0
-        
-        now = datetime.utcnow()
-        for entry in self._cache.values():
-            if entry.get("expiry") and now > entry["expiry"]:
-                expired += 1
+        expired = bisect_left(self._expiry_index, (time.monotonic_ns(),))
         
         return {
             "total_entries": total_entries,
             "active_entries": total_entries - expired,
             "expired_entries": expired,
-            "ttl_hours": self._default_ttl.total_seconds() / 3600
+            "ttl_hours": self._default_ttl_ns / (3600 * NS_PER_SECOND)
         }
 
 
 # Global cache instance
-cache_manager = CacheManager(default_ttl_hours=24)
+cache_manager = CacheManager(default_ttl_hours=settings.CACHE_TTL_HOURS)
@@ -1,8 +1,9 @@
 """
 Configuration management for PRISMA Procurement API
 """
+from dataclasses import make_dataclass
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -18,11 +19,24 @@ class Settings(BaseSettings):
     API_TITLE: str = "PRISMA Procurement API"
     API_VERSION: str = "1.0.0"
     
+    # Server Runtime
+    DEV_RELOAD: bool = True
+    API_WORKERS: Optional[int] = None  # None -> 2 * CPU count + 1
+    
+    # CORS (disable for trusted-LAN deployments to skip the middleware entirely)
+    CORS_ENABLED: bool = True
+    CORS_ORIGINS: List[str] = ["*"]
+    
     # Simulation Settings
     MIN_LATENCY_MS: int = 200
     MAX_LATENCY_MS: int = 600
     CACHE_TTL_HOURS: int = 24
     
+    # Cache TTL Policies (seconds) - short for volatile data, long for reference data
+    CACHE_TTL_SHORT_S: int = 10
+    CACHE_TTL_NORMAL_S: int = 300
+    CACHE_TTL_LONG_S: int = 3600
+    
     # Retry Configuration
     MAX_RETRIES: int = 3
     RETRY_STATUS_CODE: int = 429
@@ -40,6 +54,15 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
+# Validated snapshot frozen into a slotted dataclass: parsing happens once at
+# import, and hot-path reads are plain slot lookups that can't be mutated.
+FrozenSettings = make_dataclass(
+    "FrozenSettings",
+    [(name, field.annotation) for name, field in Settings.model_fields.items()],
+    frozen=True,
+    slots=True,
+)
+
 # Global settings instance
-settings = Settings()
+settings = FrozenSettings(**Settings().model_dump())
 
@@ -1,38 +1,129 @@
 """
 Data loader for mock supplier JSON files
 """
-import json
+import mmap
 import os
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Mapping, Sequence, Any
 from pathlib import Path
+from types import MappingProxyType
+
+import numpy as np
+import orjson
+
+
+# Files above this size are parsed from a memory map instead of being read into bytes
+MMAP_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+# Numeric supplier fields stored as contiguous float64 columns
+NUMERIC_COLUMNS = (
+    "latitude", "longitude", "price_inr_per_ton",
+    "stock_tons", "lead_time_days", "rating"
+)
+
+
+# Column buffers are aligned to a cache line (also covers 32/64-byte SIMD loads)
+COLUMN_ALIGNMENT_BYTES = 64
+
+
+def _aligned_empty(count: int, dtype=np.float64, align: int = COLUMN_ALIGNMENT_BYTES) -> np.ndarray:
+    """
+    Allocate an uninitialized 1-D array whose data starts on an `align`-byte boundary.
+    
+    NumPy only guarantees 16-byte alignment; over-allocate a byte buffer and
+    view it from the first aligned offset instead.
+    """
+    nbytes = count * np.dtype(dtype).itemsize
+    buf = np.empty(nbytes + align, dtype=np.uint8)
+    offset = (-buf.ctypes.data) % align
+    return buf[offset:offset + nbytes].view(dtype)
+
+
+def build_supplier_columns(suppliers: Sequence[Mapping[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Convert a list of supplier dicts into a Struct-of-Arrays layout.
+    
+    Row i of every column belongs to suppliers[i].
+    
+    Args:
+        suppliers: Supplier mappings
+    
+    Returns:
+        Mapping of field name to a float64 array (or object array for supplier_id),
+        plus "price_lead_rank": each row's position when ordered by
+        (price, lead time, file order), a single precomputed tie-break key,
+        and "lat_rad"/"lon_rad"/"cos_lat" for haversine_distance_rad
+    """
+    count = len(suppliers)
+    columns = {}
+    for name in NUMERIC_COLUMNS:
+        column = _aligned_empty(count)
+        column[:] = np.fromiter((s[name] for s in suppliers), dtype=np.float64, count=count)
+        columns[name] = column
+    columns["supplier_id"] = np.array([s["supplier_id"] for s in suppliers], dtype=object)
+    
+    # Supplier coordinates are fixed, so convert them (and cos(lat)) once
+    for name, source in (("lat_rad", "latitude"), ("lon_rad", "longitude")):
+        column = _aligned_empty(count)
+        np.radians(columns[source], out=column)
+        columns[name] = column
+    cos_lat = _aligned_empty(count)
+    np.cos(columns["lat_rad"], out=cos_lat)
+    columns["cos_lat"] = cos_lat
+    
+    # Price/lead time don't depend on the request, so rank them once here
+    by_price_lead = np.lexsort((columns["lead_time_days"], columns["price_inr_per_ton"]))
+    rank = np.empty(count, dtype=np.intp)
+    rank[by_price_lead] = np.arange(count)
+    columns["price_lead_rank"] = rank
+    return columns
 
 
 class SupplierDataLoader:
-    """Loads and manages mock supplier data"""
+    """Loads and manages mock supplier data (lazily, one material file at a time)"""
+    
+    MATERIAL_FILES = {
+        "cement": "cement_suppliers_mock.json",
+        "sand": "sand_suppliers_mock.json",
+        "gravel": "gravel_suppliers_mock.json",
+        "bricks": "bricks_suppliers_mock.json"
+    }
     
     def __init__(self, data_dir: str = "data"):
         self.data_dir = Path(data_dir)
-        self._cache: Dict[str, List[dict]] = {}
-        self._load_all_data()
+        # Loaded suppliers are frozen so readers can share them without copying
+        self._cache: Dict[str, Tuple[Mapping[str, Any], ...]] = {}
+        self._cols: Dict[str, Dict[str, np.ndarray]] = {}
+        self._by_id: Dict[str, Tuple[str, Mapping[str, Any]]] = {}
     
-    def _load_all_data(self):
-        """Load all supplier JSON files into memory"""
-        material_files = {
-            "cement": "cement_suppliers_mock.json",
-            "sand": "sand_suppliers_mock.json",
-            "gravel": "gravel_suppliers_mock.json",
-            "bricks": "bricks_suppliers_mock.json"
-        }
+    def _load_one(self, material_id: str):
+        """Load a single material's supplier JSON file into memory"""
+        filename = self.MATERIAL_FILES.get(material_id)
+        filepath = self.data_dir / filename if filename else None
         
-        for material_id, filename in material_files.items():
-            filepath = self.data_dir / filename
-            if filepath.exists():
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    self._cache[material_id] = json.load(f)
+        if filepath is not None and filepath.exists():
+            if filepath.stat().st_size > MMAP_THRESHOLD_BYTES:
+                with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        data = orjson.loads(view)
             else:
-                self._cache[material_id] = []
+                data = orjson.loads(filepath.read_bytes())
+            # Files wrap the supplier list in a material envelope
+            suppliers = data.get("suppliers", []) if isinstance(data, dict) else data
+            self._cache[material_id] = tuple(MappingProxyType(s) for s in suppliers)
+        else:
+            self._cache[material_id] = ()
+        self._cols[material_id] = build_supplier_columns(self._cache[material_id])
+        
+        # Index suppliers by ID for O(1) lookup
+        for s in self._cache[material_id]:
+            self._by_id[s['supplier_id']] = (material_id, s)
     
-    def get_suppliers_by_material(self, material_id: str) -> List[dict]:
+    def _ensure_loaded(self, material_id: str):
+        """Load a known material on first access"""
+        if material_id not in self._cache and material_id in self.MATERIAL_FILES:
+            self._load_one(material_id)
+    
+    def get_suppliers_by_material(self, material_id: str) -> Tuple[Mapping[str, Any], ...]:
         """
         Get all suppliers for a specific material.
         
@@ -40,11 +131,26 @@ class SupplierDataLoader:
             material_id: Material identifier (cement, sand, gravel, bricks)
         
         Returns:
-            List of supplier dictionaries
+            Read-only suppliers; build a dict (e.g. dict(s)) before mutating
+        """
+        self._ensure_loaded(material_id)
+        return self._cache.get(material_id, ())
+    
+    def get_columns(self, material_id: str) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Get the columnar (Struct-of-Arrays) view of a material's suppliers.
+        
+        Args:
+            material_id: Material identifier (cement, sand, gravel, bricks)
+        
+        Returns:
+            Mapping of field name to array, row-aligned with
+            get_suppliers_by_material(), or None if the material is unknown
         """
-        return self._cache.get(material_id, []).copy()
+        self._ensure_loaded(material_id)
+        return self._cols.get(material_id)
     
-    def get_supplier_by_id(self, supplier_id: str) -> Optional[dict]:
+    def get_supplier_by_id(self, supplier_id: str) -> Optional[Mapping[str, Any]]:
         """
         Get a specific supplier by ID.
         
@@ -52,22 +158,25 @@ class SupplierDataLoader:
             supplier_id: Unique supplier identifier
         
         Returns:
-            Supplier dictionary or None if not found
+            Read-only supplier mapping or None if not found
         """
-        for suppliers in self._cache.values():
-            for supplier in suppliers:
-                if supplier['supplier_id'] == supplier_id:
-                    return supplier.copy()
-        return None
+        entry = self._by_id.get(supplier_id)
+        if entry is None and len(self._cache) < len(self.MATERIAL_FILES):
+            # Supplier may belong to a material that hasn't been loaded yet
+            for material_id in self.MATERIAL_FILES:
+                self._ensure_loaded(material_id)
+            entry = self._by_id.get(supplier_id)
+        return entry[1] if entry else None
     
     def get_all_materials(self) -> List[str]:
         """Get list of all available materials"""
-        return list(self._cache.keys())
+        return list(self.MATERIAL_FILES.keys())
     
     def reload(self):
-        """Reload all data from disk"""
+        """Drop loaded data so it is re-read from disk on next access"""
         self._cache.clear()
-        self._load_all_data()
+        self._cols.clear()
+        self._by_id.clear()
 
 
 # Global singleton instance
@@ -2,14 +2,24 @@
 Core utility functions for PRISMA Procurement API
 """
 import math
-import random
 import asyncio
-import uuid
+import itertools
+import time
+from bisect import bisect_right
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
-from functools import lru_cache
-import json
+from typing import Dict, Any, List, Optional, Tuple
+from functools import lru_cache, wraps
 import os
+from pathlib import Path
+from types import MappingProxyType
+
+import numpy as np
+import orjson
+from fastapi import HTTPException
+
+from src.core.config import settings
+from src.core.data_loader import build_supplier_columns
+from src.domain.schemas import Supplier
 
 
 # Constants
@@ -17,13 +27,26 @@ EARTH_RADIUS_KM = 6371.0
 CO2_EMISSION_FACTOR = 0.06  # kg CO2 per ton-km
 AVG_SPEED_KM_PER_DAY = 300.0
 
+# Route quality bands: < 10 km optimal, < 30 km good, otherwise fair
+ROUTE_QUALITY_THRESHOLDS_KM = (10.0, 30.0)
+ROUTE_QUALITY_LABELS = ("optimal", "good", "fair")
+
+# Degrees-to-radians factor (same as math.radians, without the call)
+_DEG2RAD = math.pi / 180.0
+
+# Local aliases for the scalar trig hot path (skips module attribute lookups)
+_sin, _cos, _sqrt, _asin = math.sin, math.cos, math.sqrt, math.asin
+
 
-@lru_cache(maxsize=128)
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Calculate the great-circle distance between two points on Earth
     using the Haversine formula.
     
+    Uses c = 2·asin(√a), equivalent to 2·atan2(√a, √(1−a)) but one sqrt
+    cheaper; it only loses precision near antipodal points, which never
+    occur between an origin and its regional suppliers.
+    
     Args:
         lat1, lon1: Coordinates of first point (degrees)
         lat2, lon2: Coordinates of second point (degrees)
@@ -32,30 +55,241 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
         Distance in kilometers
     """
     # Convert degrees to radians once
-    lat1_rad, lat2_rad = math.radians(lat1), math.radians(lat2)
-    delta_lat, delta_lon = math.radians(lat2 - lat1), math.radians(lon2 - lon1)
+    lat1_rad, lat2_rad = lat1 * _DEG2RAD, lat2 * _DEG2RAD
+    delta_lat, delta_lon = (lat2 - lat1) * _DEG2RAD, (lon2 - lon1) * _DEG2RAD
     
     # Haversine formula (optimized)
-    sin_dlat_2 = math.sin(delta_lat / 2)
-    sin_dlon_2 = math.sin(delta_lon / 2)
+    sin_dlat_2 = _sin(delta_lat / 2)
+    sin_dlon_2 = _sin(delta_lon / 2)
     
-    a = sin_dlat_2 * sin_dlat_2 + math.cos(lat1_rad) * math.cos(lat2_rad) * sin_dlon_2 * sin_dlon_2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    a = sin_dlat_2 * sin_dlat_2 + _cos(lat1_rad) * _cos(lat2_rad) * sin_dlon_2 * sin_dlon_2
+    c = 2 * _asin(_sqrt(a))
     
     return round(EARTH_RADIUS_KM * c, 2)
 
 
+def haversine_distance_rad(lat1: float, lon1: float, lats2_rad: np.ndarray,
+                           lons2_rad: np.ndarray, cos_lats2: np.ndarray) -> np.ndarray:
+    """
+    Vectorized Haversine distance to destinations given in radians.
+    
+    Takes the destinations pre-converted (supplier columns carry lat_rad,
+    lon_rad and cos_lat), so only the origin is converted per call.
+    
+    Args:
+        lat1, lon1: Coordinates of the origin point (degrees)
+        lats2_rad, lons2_rad: Arrays of destination coordinates (radians)
+        cos_lats2: cos(lats2_rad)
+        
+    Returns:
+        Array of distances in kilometers, rounded to 2 decimals
+    """
+    lat1_rad = lat1 * _DEG2RAD
+    delta_lat = lats2_rad - lat1_rad
+    delta_lon = lons2_rad - lon1 * _DEG2RAD
+    
+    sin_dlat_2 = np.sin(delta_lat / 2)
+    sin_dlon_2 = np.sin(delta_lon / 2)
+    
+    # cos(lat1) is a scalar, broadcast against the destination column
+    a = sin_dlat_2 * sin_dlat_2 + math.cos(lat1_rad) * cos_lats2 * sin_dlon_2 * sin_dlon_2
+    c = 2 * np.arcsin(np.sqrt(a))
+    
+    return np.round(EARTH_RADIUS_KM * c, 2)
+
+
+def haversine_distance_pairs(lats1: np.ndarray, lons1: np.ndarray,
+                             lats2: np.ndarray, lons2: np.ndarray) -> np.ndarray:
+    """
+    Element-wise Haversine distances between paired points (i-th to i-th).
+    
+    Follows haversine_distance step for step, for batches of route legs.
+    
+    Args:
+        lats1, lons1: Arrays of start coordinates (degrees)
+        lats2, lons2: Arrays of end coordinates (degrees), same length
+        
+    Returns:
+        Array of distances in kilometers, rounded to 2 decimals
+    """
+    lats1 = np.asarray(lats1, dtype=np.float64)
+    lats2 = np.asarray(lats2, dtype=np.float64)
+    delta_lat = (lats2 - lats1) * _DEG2RAD
+    delta_lon = (np.asarray(lons2, dtype=np.float64) - np.asarray(lons1, dtype=np.float64)) * _DEG2RAD
+    
+    sin_dlat_2 = np.sin(delta_lat / 2)
+    sin_dlon_2 = np.sin(delta_lon / 2)
+    
+    a = sin_dlat_2 * sin_dlat_2 + np.cos(lats1 * _DEG2RAD) * np.cos(lats2 * _DEG2RAD) * sin_dlon_2 * sin_dlon_2
+    c = 2 * np.arcsin(np.sqrt(a))
+    
+    return np.round(EARTH_RADIUS_KM * c, 2)
+
+
+def haversine_distance_matrix(lats1: np.ndarray, lons1: np.ndarray, lats2_rad: np.ndarray,
+                              lons2_rad: np.ndarray, cos_lats2: np.ndarray) -> np.ndarray:
+    """
+    Haversine distances from many origins to many destinations in one pass.
+    
+    Origins are broadcast as a column against the destination row, so O
+    origins and S destinations give an (O, S) matrix without a Python loop.
+    
+    Args:
+        lats1, lons1: Arrays of origin coordinates (degrees)
+        lats2_rad, lons2_rad: Arrays of destination coordinates (radians)
+        cos_lats2: cos(lats2_rad)
+        
+    Returns:
+        Array of shape (len(lats1), len(lats2_rad)) in kilometers, rounded to 2 decimals
+    """
+    lats1_rad = np.radians(np.asarray(lats1, dtype=np.float64))[:, np.newaxis]
+    lons1_rad = np.radians(np.asarray(lons1, dtype=np.float64))[:, np.newaxis]
+    
+    sin_dlat_2 = np.sin((lats2_rad - lats1_rad) / 2)
+    sin_dlon_2 = np.sin((lons2_rad - lons1_rad) / 2)
+    
+    a = sin_dlat_2 * sin_dlat_2 + np.cos(lats1_rad) * cos_lats2 * sin_dlon_2 * sin_dlon_2
+    c = 2 * np.arcsin(np.sqrt(a))
+    
+    return np.round(EARTH_RADIUS_KM * c, 2)
+
+
+# Coarse UTC clock for response timestamps, refreshed by run_clock()
+CLOCK_TICK_SECONDS = 0.1
+_NOW_CACHE: datetime = datetime.utcnow()
+_clock_running = False
+
+
+def now_fast() -> datetime:
+    """
+    Current UTC time, to within CLOCK_TICK_SECONDS.
+    
+    Reads the value cached by run_clock() instead of the system clock;
+    falls back to datetime.utcnow() when the clock task isn't running.
+    """
+    return _NOW_CACHE if _clock_running else datetime.utcnow()
+
+
+async def run_clock(interval_seconds: float = CLOCK_TICK_SECONDS):
+    """Refresh the now_fast() timestamp every interval (run as a background task)"""
+    global _NOW_CACHE, _clock_running
+    try:
+        while True:
+            _NOW_CACHE = datetime.utcnow()
+            _clock_running = True
+            await asyncio.sleep(interval_seconds)
+    finally:
+        _clock_running = False
+
+
+# Bulk-filled uniform [0, 1) draws shared by the simulation helpers below
+_RANDOM_BUFFER_SIZE = 4096  # must be a power of two
+_RANDOM_INDEX_MASK = _RANDOM_BUFFER_SIZE - 1
+_rng = np.random.default_rng()
+_random_buf = _rng.random(_RANDOM_BUFFER_SIZE)
+_random_counter = itertools.count()
+
+
+def _next_random() -> float:
+    """Take the next uniform [0, 1) draw, refilling the buffer when it wraps."""
+    idx = next(_random_counter) & _RANDOM_INDEX_MASK
+    value = float(_random_buf[idx])
+    if idx == _RANDOM_INDEX_MASK:
+        _rng.random(out=_random_buf)
+    return value
+
+
+def _random_int(low: int, high: int) -> int:
+    """Random integer in [low, high], inclusive like random.randint."""
+    return low + int(_next_random() * (high - low + 1))
+
+
+# Simulated rate limiting: 1 in RATE_LIMIT_ONE_IN requests, retry after 1..RETRY_AFTER_MAX_S
+RATE_LIMIT_ONE_IN = 20
+RETRY_AFTER_MAX_S = 3
+
+
 async def simulate_latency(min_ms: int = 200, max_ms: int = 600):
     """
     Simulate API latency with random delay between min_ms and max_ms milliseconds.
+    
+    No-op outside sandbox mode.
     """
-    delay_ms = random.randint(min_ms, max_ms)
+    if settings.SOURCE_MODE != "sandbox":
+        return
+    delay_ms = _random_int(min_ms, max_ms)
     await asyncio.sleep(delay_ms / 1000.0)
 
 
+def sandbox_jitter(min_ms: int = 200, max_ms: int = 600, rate_limit: bool = False):
+    """
+    Decorator adding sandbox-mode behaviour to an async endpoint.
+    
+    Applies simulated latency and, if rate_limit is set, random 429
+    responses (1 in RATE_LIMIT_ONE_IN). Outside sandbox mode the
+    endpoint is returned unwrapped, so live mode pays nothing per request.
+    
+    Args:
+        min_ms, max_ms: Simulated latency range in milliseconds
+        rate_limit: Whether to also simulate rate limiting
+    """
+    def decorator(func):
+        if settings.SOURCE_MODE != "sandbox":
+            return func
+        
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            if rate_limit and _random_int(1, RATE_LIMIT_ONE_IN) == 1:
+                raise HTTPException(
+                    status_code=429,
+                    detail="Rate limit exceeded",
+                    headers={"Retry-After": str(_random_int(1, RETRY_AFTER_MAX_S))}
+                )
+            await asyncio.sleep(_random_int(min_ms, max_ms) / 1000.0)
+            return await func(*args, **kwargs)
+        
+        return wrapper
+    return decorator
+
+
+# Tracing IDs only need to be unique, not unpredictable: a per-process prefix
+# (start time + pid) plus a counter avoids a urandom syscall per request.
+# The counter starts at a random offset so workers don't share low digits,
+# which quote/route IDs use as their suffix.
+_ID_PREFIX = f"{int(time.time()):08x}{os.getpid() & 0xFFFF:04x}"
+_id_counter = itertools.count(int.from_bytes(os.urandom(3), "big"))
+
+
 def generate_request_id() -> str:
     """Generate a unique request ID for tracing."""
-    return f"req-{uuid.uuid4().hex[:12]}"
+    return f"req-{_ID_PREFIX}{next(_id_counter) & 0xFFFFFFFF:08x}"
+
+
+# YYYYMMDD for quote/route IDs, reformatted only when the day changes
+_date_stamp_day = 0
+_date_stamp = ""
+
+
+def date_stamp(now: datetime) -> str:
+    """
+    Format a timestamp's date as YYYYMMDD, memoized per day.
+    
+    Args:
+        now: Timestamp, e.g. from now_fast()
+        
+    Returns:
+        Date string for ID generation
+    """
+    global _date_stamp_day, _date_stamp
+    day = now.toordinal()
+    if day != _date_stamp_day:
+        _date_stamp_day, _date_stamp = day, f"{now:%Y%m%d}"
+    return _date_stamp
+
+
+def generate_route_id() -> str:
+    """Generate a unique route ID (ROUTE-YYYYMMDD-xxxxxx)."""
+    return f"ROUTE-{date_stamp(now_fast())}-{next(_id_counter) & 0xFFFFFF:06x}"
 
 
 def apply_price_jitter(base_price: float, min_factor: float = 0.99, max_factor: float = 1.02) -> float:
@@ -70,10 +304,26 @@ def apply_price_jitter(base_price: float, min_factor: float = 0.99, max_factor:
     Returns:
         Adjusted price with jitter
     """
-    jitter = random.uniform(min_factor, max_factor)
+    jitter = min_factor + _next_random() * (max_factor - min_factor)
     return round(base_price * jitter, 2)
 
 
+def apply_eta_jitter(eta_days: int, spread_days: int = 2) -> int:
+    """
+    Apply random jitter (±spread_days) to a delivery ETA.
+    
+    Draws from the pre-generated random buffer instead of the random module.
+    
+    Args:
+        eta_days: Estimated delivery time in days
+        spread_days: Maximum shift in either direction
+        
+    Returns:
+        Jittered ETA in days (at least 1)
+    """
+    return max(1, eta_days + _random_int(-spread_days, spread_days))
+
+
 def calculate_co2_emissions(quantity_tons: float, distance_km: float) -> float:
     """
     Calculate CO2 emissions for material transport.
@@ -85,9 +335,9 @@ def calculate_co2_emissions(quantity_tons: float, distance_km: float) -> float:
         distance_km: Transport distance in kilometers
         
     Returns:
-        CO2 emissions in kilograms
+        CO2 emissions in kilograms (unrounded; RouteETA rounds on output)
     """
-    return round(quantity_tons * distance_km * CO2_EMISSION_FACTOR, 2)
+    return quantity_tons * distance_km * CO2_EMISSION_FACTOR
 
 
 def estimate_delivery_eta(distance_km: float, base_lead_time_days: int = 0) -> int:
@@ -107,6 +357,22 @@ def estimate_delivery_eta(distance_km: float, base_lead_time_days: int = 0) -> i
     return base_lead_time_days + int(math.ceil(travel_days))
 
 
+def classify_route_quality(distance_km: float) -> str:
+    """
+    Map a route distance to its quality label via a threshold table lookup.
+    
+    For a batch of distances the same table works with
+    np.searchsorted(ROUTE_QUALITY_THRESHOLDS_KM, distances, side="right").
+    
+    Args:
+        distance_km: Route distance in kilometers
+        
+    Returns:
+        One of ROUTE_QUALITY_LABELS
+    """
+    return ROUTE_QUALITY_LABELS[bisect_right(ROUTE_QUALITY_THRESHOLDS_KM, distance_km)]
+
+
 # Material ID to filename mapping (constant)
 MATERIAL_FILE_MAP = {
     "cement_opc_53": "cement_suppliers_mock.json",
@@ -120,9 +386,29 @@ MATERIAL_FILE_MAP = {
     "bricks": "bricks_suppliers_mock.json"
 }
 
+# Supplier data directory and per-material file paths, resolved once at import
+_DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data"
+_FILE_PATH_CACHE: Dict[str, Path] = {k: _DATA_DIR / v for k, v in MATERIAL_FILE_MAP.items()}
+
 # Cache for loaded supplier data
 _supplier_data_cache: Dict[str, Dict[str, Any]] = {}
 
+# Struct-of-Arrays view per material, row-aligned with data["suppliers"]
+_supplier_columns_cache: Dict[str, Dict[str, np.ndarray]] = {}
+
+# Validated Supplier models per material (distance_km unset), row-aligned too
+_supplier_models_cache: Dict[str, Tuple[Supplier, ...]] = {}
+
+# supplier_id -> row index per material (first occurrence wins)
+_supplier_index_cache: Dict[str, Dict[str, int]] = {}
+
+# Default ranking criteria (distance → price → lead_time)
+DEFAULT_RANKING_CRITERIA = ["distance_km", "price_inr_per_ton", "lead_time_days"]
+
+
+class UnknownMaterialError(ValueError):
+    """Raised when a material ID has no supplier data file"""
+
 
 def load_supplier_data(material_id: str) -> Dict[str, Any]:
     """
@@ -133,124 +419,238 @@ def load_supplier_data(material_id: str) -> Dict[str, Any]:
         
     Returns:
         Dictionary containing supplier data
+        
+    Raises:
+        UnknownMaterialError: If the material is not known
     """
     material_key = material_id.lower()
     
     # Return from cache if available
-    if material_key in _supplier_data_cache:
-        return _supplier_data_cache[material_key]
-    
-    # Get filename from mapping
-    filename = MATERIAL_FILE_MAP.get(material_key)
-    if not filename:
-        raise ValueError(f"Unknown material_id: {material_id}")
+    data = _supplier_data_cache.get(material_key)
+    if data is not None:
+        return data
     
-    # Get the data directory path
-    current_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-    file_path = os.path.join(current_dir, "data", filename)
+    # Get file path from mapping; once preloaded, every known material is cached
+    file_path = _FILE_PATH_CACHE.get(material_key)
+    if file_path is None or isinstance(_supplier_data_cache, MappingProxyType):
+        raise UnknownMaterialError(f"Unknown material_id: {material_id}")
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            # Cache the loaded data
-            _supplier_data_cache[material_key] = data
-            return data
+        with open(file_path, 'rb') as f:
+            data = orjson.loads(f.read())
     except FileNotFoundError:
         raise FileNotFoundError(f"Supplier data file not found: {file_path}")
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in supplier data file: {e}")
+    
+    # Cache the parsed data and derive its column arrays and models once, so
+    # the request path never walks the JSON tree or re-validates suppliers
+    suppliers = data.get("suppliers", [])
+    _supplier_columns_cache[material_key] = build_supplier_columns(suppliers)
+    _supplier_models_cache[material_key] = tuple(Supplier(**s) for s in suppliers)
+    index: Dict[str, int] = {}
+    for row, supplier in enumerate(suppliers):
+        index.setdefault(supplier["supplier_id"], row)
+    _supplier_index_cache[material_key] = index
+    _supplier_data_cache[material_key] = data
+    return data
+
+
+def preload_supplier_data():
+    """
+    Load every supplier file in MATERIAL_FILE_MAP and freeze the caches.
+    
+    Each file is parsed once and shared by all of its aliases. Meant to run
+    at startup so a missing or malformed file fails at boot, not per request.
+    """
+    global _supplier_data_cache, _supplier_columns_cache, _supplier_models_cache
+    global _supplier_index_cache
+    
+    if isinstance(_supplier_data_cache, MappingProxyType):
+        return
+    
+    by_filename: Dict[str, str] = {}
+    for material_key, filename in MATERIAL_FILE_MAP.items():
+        first_key = by_filename.setdefault(filename, material_key)
+        if first_key == material_key:
+            load_supplier_data(material_key)
+        else:
+            _supplier_data_cache[material_key] = _supplier_data_cache[first_key]
+            _supplier_columns_cache[material_key] = _supplier_columns_cache[first_key]
+            _supplier_models_cache[material_key] = _supplier_models_cache[first_key]
+            _supplier_index_cache[material_key] = _supplier_index_cache[first_key]
+    
+    # Read-only from here on
+    _supplier_data_cache = MappingProxyType(_supplier_data_cache)
+    _supplier_columns_cache = MappingProxyType(_supplier_columns_cache)
+    _supplier_models_cache = MappingProxyType(_supplier_models_cache)
+    _supplier_index_cache = MappingProxyType(_supplier_index_cache)
 
 
-def should_trigger_rate_limit() -> bool:
+def get_supplier_columns(material_id: str) -> Dict[str, np.ndarray]:
     """
-    Randomly trigger rate limit (429) with 1/20 probability (5% chance).
+    Get the Struct-of-Arrays view of a material's suppliers.
+    
+    Args:
+        material_id: Material identifier (e.g., 'cement_opc_53')
+        
+    Returns:
+        Mapping of field name to array (latitude, longitude, stock_tons,
+        price_inr_per_ton, lead_time_days, rating, supplier_id,
+        price_lead_rank), row-aligned with the material's supplier list
     """
-    return random.randint(1, 20) == 1
+    load_supplier_data(material_id)
+    return _supplier_columns_cache[material_id.lower()]
 
 
-def get_retry_after_seconds() -> int:
+def find_supplier_row(material_id: str, supplier_id: str) -> Optional[int]:
     """
-    Get random retry-after delay in seconds (1-3 seconds).
+    Look up a supplier's row index by ID in O(1).
+    
+    Args:
+        material_id: Material identifier (e.g., 'cement_opc_53')
+        supplier_id: Unique supplier identifier
+        
+    Returns:
+        Row index into the material's supplier list, models and columns,
+        or None if the supplier isn't listed for this material
     """
-    return random.randint(1, 3)
+    load_supplier_data(material_id)
+    return _supplier_index_cache[material_id.lower()].get(supplier_id)
 
 
-def rank_suppliers(suppliers: List[Dict[str, Any]], 
-                   criteria: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+def get_supplier_models(material_id: str) -> Tuple[Supplier, ...]:
+    """
+    Get a material's suppliers as Supplier models, validated once at load.
+    
+    The models are shared; derive per-request variants with
+    model_copy(update={...}) rather than mutating them.
+    
+    Args:
+        material_id: Material identifier (e.g., 'cement_opc_53')
+        
+    Returns:
+        Supplier models (distance_km unset), row-aligned with the columns
+    """
+    load_supplier_data(material_id)
+    return _supplier_models_cache[material_id.lower()]
+
+
+def rank_suppliers(columns: Dict[str, np.ndarray], distances: np.ndarray,
+                   criteria: Optional[List[str]] = None) -> np.ndarray:
     """
     Rank suppliers by multiple criteria (distance → price → lead_time).
     
     Args:
-        suppliers: List of supplier dictionaries
+        columns: Supplier column arrays (see get_supplier_columns)
+        distances: Distance from origin per supplier row
         criteria: Ranking criteria in order of priority
         
     Returns:
-        Sorted list of suppliers
+        Row indices in ranked order (ties keep file order)
+    """
+    # Default criteria: only distance varies per request; price → lead_time
+    # (and file order) are folded into the precomputed rank column
+    if criteria is None or criteria == DEFAULT_RANKING_CRITERIA:
+        return np.lexsort((columns["price_lead_rank"], distances))
+    
+    keys = [distances if c == "distance_km" else columns[c] for c in criteria]
+    
+    # lexsort treats the last key as primary, so pass criteria in reverse
+    return np.lexsort(keys[::-1])
+
+
+@lru_cache(maxsize=1024)
+def rank_suppliers_for_origin(material_id: str, latitude: float,
+                              longitude: float) -> Tuple[np.ndarray, Tuple[float, ...], np.ndarray]:
     """
-    if not suppliers:
-        return []
+    Distances and default ranking of a material's suppliers from one origin.
     
-    # Default criteria
-    if criteria is None:
-        criteria = ["distance_km", "price_inr_per_ton", "lead_time_days"]
+    Supplier coordinates are fixed, so the result depends only on
+    (material, origin). Caching here, rather than per haversine call, lets
+    repeat searches from the same site (e.g. different quantities) skip
+    both the distance pass and the sort. The hit rate is available via
+    rank_suppliers_for_origin.cache_info().
     
-    # Optimized multi-criteria sorting
-    return sorted(
-        suppliers,
-        key=lambda s: tuple(s.get(c, float('inf')) for c in criteria)
+    Args:
+        material_id: Material identifier (e.g., 'cement_opc_53')
+        latitude, longitude: Origin coordinates (degrees)
+        
+    Returns:
+        Tuple of (distance array, distances as Python floats, ranked row
+        indices); arrays are read-only since they are shared between callers
+    """
+    columns = get_supplier_columns(material_id)
+    distances = haversine_distance_rad(
+        latitude, longitude, columns["lat_rad"], columns["lon_rad"], columns["cos_lat"]
     )
+    order = rank_suppliers(columns, distances)
+    distances.flags.writeable = False
+    order.flags.writeable = False
+    return distances, tuple(distances.tolist()), order
 
 
-def filter_eligible_suppliers(suppliers: List[Dict[str, Any]], 
-                               required_quantity: float) -> List[Dict[str, Any]]:
+def rank_suppliers_for_origins(material_id: str, latitudes: List[float],
+                               longitudes: List[float]) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Filter suppliers that have sufficient stock.
+    Distances and default ranking of a material's suppliers from several origins.
+    
+    Batch counterpart of rank_suppliers_for_origin: one broadcast distance
+    pass and one row-wise lexsort for all origins. Ties break on the
+    precomputed price/lead-time rank, as in rank_suppliers.
     
     Args:
-        suppliers: List of supplier dictionaries
-        required_quantity: Required quantity in tons
+        material_id: Material identifier (e.g., 'cement_opc_53')
+        latitudes, longitudes: Origin coordinates (degrees)
         
     Returns:
-        List of eligible suppliers
+        Tuple of (origins x suppliers distance matrix, ranked row indices per origin)
     """
-    return [s for s in suppliers if s.get("stock_tons", 0) >= required_quantity]
+    columns = get_supplier_columns(material_id)
+    distances = haversine_distance_matrix(
+        latitudes, longitudes, columns["lat_rad"], columns["lon_rad"], columns["cos_lat"]
+    )
+    tie_break = np.broadcast_to(columns["price_lead_rank"], distances.shape)
+    return distances, np.lexsort((tie_break, distances), axis=-1)
 
 
-def create_split_plan(suppliers: List[Dict[str, Any]], 
-                      required_quantity: float) -> List[Dict[str, Any]]:
+def plan_procurement(columns: Dict[str, np.ndarray], order: np.ndarray,
+                     required_quantity: float,
+                     max_split: int = 3) -> Tuple[Optional[int], List[Tuple[int, float]]]:
     """
-    Create a split procurement plan if no single supplier can meet demand.
+    Pick the recommended supplier, or a split plan, in one pass over the columns.
+    
+    One stock gather over the ranked order picks the first row with enough
+    stock; otherwise at most max_split rows form the split, all on row
+    indices (no supplier dicts are copied).
     
     Args:
-        suppliers: List of ranked suppliers
+        columns: Supplier column arrays (see get_supplier_columns)
+        order: Ranked row indices, e.g. from rank_suppliers
         required_quantity: Required quantity in tons
+        max_split: Maximum number of suppliers in a split plan
         
     Returns:
-        List of suppliers with allocated quantities
+        Tuple of (recommended row or None, split allocations as
+        (row, allocated_tons)); the split is empty when one supplier suffices
     """
-    if not suppliers:
-        return []
+    ranked_stock = columns["stock_tons"][order]
     
-    split_plan = []
-    remaining = required_quantity
+    # Best single supplier: first ranked row with enough stock
+    eligible = ranked_stock >= required_quantity
+    if eligible.any():
+        return int(order[eligible.argmax()]), []
     
-    # Sort by best ranking (already sorted)
-    for supplier in suppliers[:3]:  # Max 3 suppliers in split
-        available = supplier.get("stock_tons", 0)
+    # Otherwise split across the top-ranked suppliers that have stock
+    split: List[Tuple[int, float]] = []
+    remaining = required_quantity
+    for row, available in zip(order[:max_split].tolist(), ranked_stock[:max_split].tolist()):
         if available <= 0:
             continue
-            
         allocation = min(available, remaining)
-        if allocation > 0:
-            split_supplier = supplier.copy()
-            split_supplier["allocated_tons"] = round(allocation, 2)
-            split_supplier["estimated_cost_inr"] = round(
-                allocation * supplier.get("price_inr_per_ton", 0), 2
-            )
-            split_plan.append(split_supplier)
-            remaining -= allocation
-            
+        split.append((row, allocation))
+        remaining -= allocation
         if remaining <= 0:
             break
     
-    return split_plan
+    return (split[0][0] if split else None), split
@@ -3,7 +3,7 @@ Pydantic schemas for PRISMA Procurement API
 
 Defines all data contracts: Origin, Supplier, SupplierBundle, Quote, RouteETA, Provenance
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer
 from typing import List, Optional
 from datetime import datetime
 from enum import Enum
@@ -94,12 +94,13 @@ class SupplierBundle(BaseModel):
     origin: Origin = Field(..., description="Request origin location")
     material: str = Field(..., description="Requested material type")
     quantity_tons: float = Field(..., description="Requested quantity in tons", ge=0)
-    suppliers: List[Supplier] = Field(..., description="All matching suppliers")
+    suppliers: List[Supplier] = Field(..., description="Top-ranked matching suppliers (up to the requested limit)")
     recommended: Optional[Supplier] = Field(None, description="Top-ranked supplier recommendation")
     ranking_criteria: List[str] = Field(
         default=["distance", "price", "lead_time"],
         description="Criteria used for ranking"
     )
+    total_count: Optional[int] = Field(None, description="Number of matching suppliers before the limit", ge=0)
     provenance: Provenance = Field(..., description="Data provenance metadata")
     
     class Config:
@@ -115,6 +116,7 @@ class SupplierBundle(BaseModel):
                 "suppliers": [],
                 "recommended": None,
                 "ranking_criteria": ["distance", "price", "lead_time"],
+                "total_count": 0,
                 "provenance": {
                     "provider": "mock-sandbox",
                     "cache": False,
@@ -172,6 +174,11 @@ class RouteETA(BaseModel):
     route_quality: str = Field(..., description="Route quality indicator (e.g., 'optimal', 'good', 'fair')")
     provenance: Provenance = Field(..., description="Data provenance metadata")
     
+    @field_serializer("co2_kg")
+    def _round_co2(self, value: float) -> float:
+        """Round emissions once, at output (the calculation keeps full precision)"""
+        return round(value, 2)
+    
     class Config:
         json_schema_extra = {
             "example": {
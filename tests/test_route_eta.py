@@ -0,0 +1,56 @@
+"""
+Destination validation for the route ETA endpoints
+"""
+import os
+
+# Skip simulated sandbox latency so the tests run quickly
+os.environ.setdefault("MIN_LATENCY_MS", "0")
+os.environ.setdefault("MAX_LATENCY_MS", "0")
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+
+ORIGIN = {"latitude": 17.3352, "longitude": 78.4537}
+BAD_DESTINATIONS = [
+    {"latitude": "17.3345", "longitude": "78.4512"},
+    {"latitude": True, "longitude": 78.4512},
+    {"latitude": 17.3345},
+    {"latitude": 95.0, "longitude": 78.4512},
+]
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+
+@pytest.mark.parametrize("destination", BAD_DESTINATIONS)
+def test_single_route_rejects_bad_destination(client, destination):
+    response = client.post("/ext/route/eta", json={"origin": ORIGIN, "destination": destination})
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("destination", BAD_DESTINATIONS)
+def test_batch_route_rejects_bad_destination(client, destination):
+    good = {"origin": ORIGIN, "destination": {"latitude": 17.3345, "longitude": 78.4512}}
+    bad = {"origin": ORIGIN, "destination": destination}
+    response = client.post("/ext/route/eta_batch", json={"routes": [good, bad]})
+    assert response.status_code == 400
+
+
+def test_batch_route_matches_single_route(client):
+    leg = {
+        "origin": ORIGIN,
+        "destination": {"latitude": 17.3616, "longitude": 78.4747, "name": "Depot"},
+        "quantity_tons": 50.0,
+    }
+    single = client.post("/ext/route/eta", json=leg)
+    batch = client.post("/ext/route/eta_batch", json={"routes": [leg]})
+    assert single.status_code == batch.status_code == 200
+
+    fields = ("destination", "distance_km", "duration_minutes", "co2_kg", "route_quality")
+    assert {k: batch.json()[0][k] for k in fields} == {k: single.json()[k] for k in fields}